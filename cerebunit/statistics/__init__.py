@@ -0,0 +1,4 @@
+# ~/cerebunit/cerebunit/statistics/__init__.py
+#from cerebunit.statistics import stat_scores
+#from . import data_conditions
+#from . import hypothesis_testings
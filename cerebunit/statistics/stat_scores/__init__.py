@@ -0,0 +1,2 @@
+# ~/cerebunit/cerebunit/statistics/stat_scores/__init__.py
+from .zSignScore import ZScoreForSignTest
@@ -0,0 +1,57 @@
+# ~/cerebunit/cerebunit/statistics/stat_scores/_sign_stat_aot.py
+#
+# =============================================================================
+# _sign_stat_aot.py
+#
+# AOT (ahead-of-time) build script for the sign-test kernels used by
+# zSignScore.py. Running
+#
+#     python _sign_stat_aot.py
+#
+# at package build time produces a compiled extension module named
+# _sign_stat_aot next to this file. zSignScore.py prefers that extension
+# over @njit so short-lived SciUnit runs pay no per-process JIT warm-up;
+# when the extension has not been built it falls back to the JIT kernels.
+#
+# =============================================================================
+
+from numba.pycc import CC
+
+cc = CC('_sign_stat_aot')
+
+
+@cc.export('sign_stat', 'UniTuple(int64,2)(float64[:], float64)')
+def sign_stat( data, eta ):
+    """Single fused pass accumulating S+ and n_u for null value eta."""
+    splus = 0
+    nu = 0
+    for i in range( data.shape[0] ):
+        splus += int( data[i] < eta )
+        nu += int( data[i] != eta )
+    return splus, nu
+
+
+@cc.export('sign_stat_f32', 'UniTuple(int64,2)(float32[:], float64)')
+def sign_stat_f32( data, eta ):
+    """float32-data variant of sign_stat (pycc has no overload dispatch)."""
+    splus = 0
+    nu = 0
+    for i in range( data.shape[0] ):
+        splus += int( data[i] < eta )
+        nu += int( data[i] != eta )
+    return splus, nu
+
+
+@cc.export('sign_stat_paired', 'UniTuple(int64,2)(float64[:], float64[:])')
+def sign_stat_paired( data, pred ):
+    """As sign_stat but element-wise null values (paired data, eta_0 = 0)."""
+    splus = 0
+    nu = 0
+    for i in range( data.shape[0] ):
+        splus += int( data[i] < pred[i] )
+        nu += int( data[i] != pred[i] )
+    return splus, nu
+
+
+if __name__ == "__main__":
+    cc.compile()
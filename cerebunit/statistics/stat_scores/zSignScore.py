@@ -0,0 +1,182 @@
+# ~/cerebunit/cerebunit/statistics/stat_scores/zSignScore.py
+#
+# =============================================================================
+# zSignScore.py
+#
+# created 10 July 2019
+# modified
+#
+# =============================================================================
+
+import math
+
+import numpy as np
+import sciunit
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+def _sign_stat_ref( data, null_value ):
+    """Fused S+ and n_u reductions. null_value is either a scalar (single
+    sample testing) or an array of element-wise null values (paired data).
+    Pure-NumPy reference used when numba is absent; under numba it is the
+    overload target that gets specialized per null_value type."""
+    splus = int( np.count_nonzero( data < null_value ) )
+    nu = int( np.count_nonzero( data != null_value ) )
+    return splus, nu
+
+_sign_stat = None
+
+try: # prefer the AOT-compiled kernels; no JIT warm-up in short-lived runs
+    from . import _sign_stat_aot as _aot
+except ImportError:
+    _aot = None
+if _aot is not None and not hasattr( _aot, "cc" ): # compiled ext, not the build script
+    def _sign_stat( data, null_value ):
+        if np.ndim( null_value ): # paired data
+            return _aot.sign_stat_paired( data, null_value )
+        if data.dtype == np.float32:
+            return _aot.sign_stat_f32( data, null_value )
+        return _aot.sign_stat( data, null_value )
+
+if _sign_stat is None and numba is not None:
+    # JIT kernels only when the AOT extension is absent, so its warm-up
+    # (or cache load) is never paid on a path that would be shadowed
+    from numba.core import types
+    from numba.extending import overload
+
+    @overload( _sign_stat_ref,
+               jit_options={"parallel": True, "fastmath": True, "boundscheck": False} )
+    def _ov_sign_stat_ref( data, null_value ):
+        if isinstance( null_value, types.Array ): # paired data, eta_0 = 0
+            def paired( data, null_value ):
+                splus = 0
+                nu = 0
+                for i in numba.prange( data.shape[0] ):
+                    splus += int( data[i] < null_value[i] )
+                    nu += int( data[i] != null_value[i] )
+                return splus, nu
+            return paired
+        else: # single sample testing, eta_0 hoisted into a register
+            def scalar( data, null_value ):
+                splus = 0
+                nu = 0
+                for i in numba.prange( data.shape[0] ):
+                    # branchless compares let LLVM auto-vectorize the reduction
+                    splus += int( data[i] < null_value )
+                    nu += int( data[i] != null_value )
+                return splus, nu
+            return scalar
+    #
+    # eager signatures => specializations compiled at import, not on first call
+    @numba.njit( [ "UniTuple(int64,2)(float64[:], float64)",
+                   "UniTuple(int64,2)(float32[:], float64)",
+                   "UniTuple(int64,2)(float64[:], float64[:])" ],
+                 parallel=True, cache=True, fastmath=True, boundscheck=False )
+    def _sign_stat( data, null_value ):
+        return _sign_stat_ref( data, null_value )
+
+
+# ==========================ZScoreForSignTest==================================
+class ZScoreForSignTest(sciunit.Score):
+    """
+    Compute z-statistic for Sign Test.
+
+    .. table:: Title here
+
+    ================ ==============================================================================
+      Definitions      Interpretation
+    ================ ==============================================================================
+     :math:`\\eta_0`   some specified value :math:`^{\\dagger}`
+     :math:`S^{+}`     number of values in sample :math:`> \\eta_0`
+     :math:`S^{-}`     number of values in sample :math:`< \\eta_0`
+     :math:`n_u`       number of values in sample :math:`\\neq \\eta_0`, i.e, :math:`S^{+} + S^{-}`
+     z-statistic, z    z = :math:`\\frac{ S^{+} - \\frac{n_u}{2} }{ \\sqrt{ \\frac{n_u}{4} } }`
+    ================ ==============================================================================
+
+    :math:`^{\\dagger} \\eta_0`, null value is
+
+    * the model prediction for one sample testing
+    * 0 for testing with paired data (observation - prediction)
+
+    **Use Case:**
+
+    ::
+
+      x = ZScoreForSignTest.compute( observation, prediction )
+      score = ZScoreForSignTest(x)
+
+    *Note*: As part of the SciUnit framework this custom :py:class:`.TScore` should have the following methods,
+
+    * :py:meth:`.compute` (class method)
+    * :py:meth:`.sort_key` (property)
+    * :py:meth:`.__str__`
+
+    """
+    #
+    # -----------------------------Use Case-----------------------------------
+    # x = ZScoreForSignTest.compute( observation, prediction )
+    # score = ZScoreForSignTest(x)
+    # ------------------------------------------------------------------------
+    #
+    _allowed_types = (float,)
+    _description = ( "ZScoreForSignTest gives the z-statistic applied to medians. "
+                   + "The experimental data (observation) is taken as the sample. "
+                   + "The null-value is the 'some' specified value which is taken to be the predicted value generated from running the model. " )
+    #
+    @classmethod
+    def compute(cls, observation, prediction):
+        """
+        +--------------------------+------------------------------------------------+
+        | Argument                 | Value type                                     |
+        +==========================+================================================+
+        | first argument           | dictionary; observation/experimental data      |
+        +--------------------------+------------------------------------------------+
+        | second argument          | floating number or array                       |
+        +--------------------------+------------------------------------------------+
+
+        *Note:*
+
+        * observation **must** have the key "raw_data" whose value is the list of numbers
+
+        """
+        if "_raw_np" in observation: # marshalled once by the validation test
+            data = observation["_raw_np"]
+        else:
+            try: # reuse the converted buffer across repeated hypothesis testing
+                data = observation["_raw_data_np"]
+            except KeyError:
+                data = np.asarray( observation["raw_data"], dtype=np.float64 )
+                observation["_raw_data_np"] = data
+        if data.size == 0: # no sample, no statistic; skip all O(n) work
+            return float("nan")
+        if np.array( prediction ).shape==(): # single sample testing, eta_0 = prediction
+            # plain python float => C-side float64 comparisons in the kernel
+            null_value = float( prediction.magnitude ) if hasattr( prediction, "magnitude" ) \
+                         else float( prediction )
+            # half the bytes per compare pass; compiled kernels only — they
+            # promote data[i] to float64, whereas the NumPy fallback would
+            # demote eta_0 to float32 and round the null value
+            if "_raw_np32" in observation and _sign_stat is not None:
+                data = observation["_raw_np32"]
+        else: # testing with paired data, eta_0 = 0
+            null_value = np.asarray( prediction, dtype=np.float64 )
+        if _sign_stat is not None:
+            splus, n_u = _sign_stat( data, null_value )
+        else:
+            splus, n_u = _sign_stat_ref( data, null_value )
+        if n_u == 0: # every value equals eta_0; the statistic is undefined
+            return float("nan")
+        # (S+ - n_u/2) / sqrt(n_u/4) with sqrt(n_u/4) folded to sqrt(n_u)/2;
+        # math.sqrt skips the ufunc dispatch np.sqrt pays on a scalar
+        return (splus - 0.5*n_u) * (2.0 / math.sqrt(n_u)) # z_statistic
+    #
+    @property
+    def sort_key(self):
+        return self.score
+    #
+    def __str__(self):
+        return "ZScore is " + str(self.score)
+# ============================================================================
@@ -15,7 +15,7 @@ import quantities as pq
 from cerebunit.capabilities.cells.measurements import ProducesSomaInputR
 from cerebstats.data_conditions import NecessaryForHTMeans
 from cerebstats.stat_scores import TScore # if NecessaryForHTMeans passes
-from cerebstats.stat_scores import ZScoreForSignTest as ZScore
+from cerebunit.statistics.stat_scores import ZScoreForSignTest as ZScore
 from cerebstats.hypothesis_testings import HtestAboutMeans, HtestAboutMedians
 
 # to execute the model you must be in ~/cerebmodels
@@ -101,8 +101,17 @@ class SomaRinTest(sciunit.Test):
                                                 units=self.observation["units"] )
         self.observation["SD"] = pq.Quantity( observation["SD"]*1E6,
                                               units=self.observation["units"] )
-        self.observation["raw_data"] = pq.Quantity( [ x*1E6 for x in observation["raw_data"] ],
-                                                    units=self.observation["units"] )
+        # one vectorized pass instead of n python-level multiplies; the flat
+        # float64 buffer is kept alongside so that the statistics kernels
+        # (ZScore.compute, HtestAboutMedians) need no re-conversion
+        raw_np = numpy.asarray( observation["raw_data"], dtype=numpy.float64 ) * 1E6
+        self.observation["raw_data"] = pq.Quantity( raw_np, units=self.observation["units"] )
+        self.observation["_raw_np"] = raw_np
+        raw_np32 = raw_np.astype( numpy.float32 )
+        if raw_np.size and ( raw_np32 == raw_np ).all(): # exact round-trip only,
+            # so the sign-test comparisons are unchanged; half-width copy for
+            # the memory-bound compare pass
+            self.observation["_raw_np32"] = raw_np32
         self.datacond = NecessaryForHTMeans.ask( observation["sample_size"],
                                                  self.observation["raw_data"] )
         if self.datacond==True:
@@ -112,7 +121,19 @@ class SomaRinTest(sciunit.Test):
                                units=observation["units"] )
         else:
             self.score_type = ZScore
-            self.observation["median"] = numpy.median(self.observation["raw_data"])
+            # HtestAboutMedians requires observation["median"]; select the
+            # middle order statistic(s) from the flat buffer via introselect
+            # (O(n)) rather than sorting the Quantity-wrapped raw_data
+            n = raw_np.size
+            if n == 0:
+                med = float("nan")
+            elif n % 2:
+                med = numpy.partition( raw_np, n//2 )[n//2]
+            else:
+                part = numpy.partition( raw_np, [n//2 - 1, n//2] )
+                med = 0.5 * ( part[n//2 - 1] + part[n//2] )
+            self.observation["median"] = pq.Quantity( med,
+                                                      units=self.observation["units"] )
         # parameters for properly running the test
         self.observation["celsius"] = observation["protocol_parameters"]["temperature"]
         self.observation["v_init"] = observation["protocol_parameters"]["initial_resting_Vm"]
@@ -134,7 +155,7 @@ class SomaRinTest(sciunit.Test):
         stimparam = {"type": ["current", "IClamp"],
                  "stimlist": [ {"amp": self.observation["amp"], "dur": 200.0, "delay": 400.0},
                                {"amp": 0.0, "dur": 200.0, "delay": 400.0+200.},
-                               {"amp": self.observation["amp"], "dur": 200.0, "delay": 600.0+200.0],
+                               {"amp": self.observation["amp"], "dur": 200.0, "delay": 600.0+200.0} ],
                     "tstop": runtimeparam["tstop"] }
         ec = ExecutiveControl()
         #ec.chosenmodel = model
@@ -16,6 +16,9 @@ setup(
                   # capabilities 
                   "cerebunit.capabilities",
                   "cerebunit.capabilities.cells",
+                  # statistics
+                  "cerebunit.statistics",
+                  "cerebunit.statistics.stat_scores",
                   # validation_tests
                   "cerebunit.validation_tests",
                   "cerebunit.validation_tests.cells",